@@ -1,5 +1,8 @@
+import concurrent.futures
+import io
 import os
 import re
+import threading
 from pathlib import Path
 
 import pandas as pd
@@ -36,6 +39,14 @@ PLAYER_MATCH_STAT_TYPES = [
     "possession",
     "misc",
 ]
+FETCH_WORKERS = 8
+# soccerdata throttles requests per reader instance, so cap how many readers
+# hit fbref.com at once; the remaining workers still overlap cache reads,
+# parsing and Parquet writes.
+FBREF_CONCURRENCY = 2
+_FBREF_SLOTS = threading.Semaphore(FBREF_CONCURRENCY)
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+_NORM_RE = re.compile(r"[^A-Za-z0-9]+")
 
 
 def _parse_seasons(raw: str | None) -> list[str]:
@@ -54,7 +65,7 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     normalized = []
     seen = {}
     for col in columns:
-        col = re.sub(r"[^A-Za-z0-9]+", "_", col).strip("_").lower()
+        col = _NORM_RE.sub("_", col).strip("_").lower()
         if not col:
             col = "col"
         count = seen.get(col, 0)
@@ -65,30 +76,61 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
         seen[col] = count + 1
         normalized.append(new_col)
 
-    df = df.copy()
-    df.columns = normalized
+    return df.set_axis(normalized, axis=1)
+
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    int_cols = df.select_dtypes(include="integer").columns
+    float_cols = df.select_dtypes(include="float").columns
+    if len(int_cols):
+        df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast="integer")
+    if len(float_cols):
+        df[float_cols] = df[float_cols].apply(pd.to_numeric, downcast="float")
     return df
 
 
 def _infer_sql_type(series: pd.Series) -> str:
-    if pd.api.types.is_integer_dtype(series):
-        return "INTEGER"
-    if pd.api.types.is_float_dtype(series):
-        return "DOUBLE PRECISION"
+    # Widths must match the dtype exactly: the ADBC binary COPY path writes
+    # field sizes from the Arrow schema, and Postgres rejects e.g. float4
+    # data in a DOUBLE PRECISION column.
     if pd.api.types.is_bool_dtype(series):
         return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(series):
+        if series.dtype.itemsize <= 2:
+            return "SMALLINT"
+        if series.dtype.itemsize <= 4:
+            return "INTEGER"
+        return "BIGINT"
+    if pd.api.types.is_float_dtype(series):
+        return "REAL" if series.dtype.itemsize <= 4 else "DOUBLE PRECISION"
     if pd.api.types.is_datetime64_any_dtype(series):
         return "TIMESTAMPTZ"
     return "TEXT"
 
 
-def _ensure_table_schema(df: pd.DataFrame, table_name: str, engine) -> None:
+def _snapshot_table_metadata(engine) -> tuple[set[str], dict[str, set[str]]]:
     inspector = inspect(engine)
-    if not inspector.has_table(table_name):
+    existing_tables = set(inspector.get_table_names())
+    table_cols = {
+        table: {col["name"] for col in inspector.get_columns(table)} for table in existing_tables
+    }
+    return existing_tables, table_cols
+
+
+def _ensure_table_schema(
+    df: pd.DataFrame,
+    table_name: str,
+    engine,
+    existing_tables: set[str],
+    table_cols: dict[str, set[str]],
+) -> None:
+    if table_name not in existing_tables:
         df.head(0).to_sql(table_name, engine, if_exists="append", index=False)
+        existing_tables.add(table_name)
+        table_cols[table_name] = set(df.columns)
         return
 
-    existing = {col["name"] for col in inspector.get_columns(table_name)}
+    existing = table_cols[table_name]
     missing = [col for col in df.columns if col not in existing]
     if not missing:
         return
@@ -97,11 +139,13 @@ def _ensure_table_schema(df: pd.DataFrame, table_name: str, engine) -> None:
         for col in missing:
             sql_type = _infer_sql_type(df[col])
             conn.execute(text(f'ALTER TABLE "{table_name}" ADD COLUMN "{col}" {sql_type}'))
+    existing.update(missing)
 
 
-def _delete_existing_rows(engine, table_name: str, seasons: list[str]) -> None:
-    inspector = inspect(engine)
-    if not inspector.has_table(table_name):
+def _delete_existing_rows(
+    engine, table_name: str, seasons: list[str], existing_tables: set[str]
+) -> None:
+    if table_name not in existing_tables:
         return
 
     with engine.begin() as conn:
@@ -117,16 +161,102 @@ def _delete_existing_rows(engine, table_name: str, seasons: list[str]) -> None:
         )
 
 
+def _fetch_match_stats(
+    kind: str, stat_type: str, seasons: list[str], refresh: bool = False
+) -> pd.DataFrame:
+    cache = CACHE_DIR / f"fbref_{kind}_{stat_type}_{'_'.join(seasons)}.parquet"
+    if cache.exists() and not refresh:
+        print(f"  Using cached {kind} {stat_type} ({cache.name})...")
+        return pd.read_parquet(cache)
+
+    print(f"  Fetching {kind} {stat_type} ({len(seasons)} seasons)...")
+    with _FBREF_SLOTS:
+        fbref = sd.FBref(leagues=COMPETITION, seasons=seasons)
+        if kind == "team":
+            stats = fbref.read_team_match_stats(stat_type=stat_type).reset_index()
+        else:
+            stats = fbref.read_player_match_stats(stat_type=stat_type).reset_index()
+    stats = _normalize_columns(stats)
+    stats = _downcast_numeric(stats)
+    # soccerdata canonicalizes season ids; map them back to the requested labels.
+    season_map = dict(zip(fbref.seasons, seasons))
+    stats["season"] = stats["season"].map(season_map).fillna(stats["season"])
+    stats["competition"] = COMPETITION
+    stats["source"] = SOURCE
+    stats = stats.astype({"season": "category", "competition": "category", "source": "category"})
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    stats.to_parquet(cache, compression="zstd", engine="pyarrow")
+    return stats
+
+
+def _copy_from_df(df: pd.DataFrame, table_name: str, engine) -> None:
+    if df.empty:
+        return
+
+    try:
+        import adbc_driver_postgresql.dbapi as adbc_pg
+        import pyarrow as pa
+    except ImportError:
+        _copy_from_csv(df, table_name, engine)
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Postgres has no dictionary type; decode categorical columns to plain values.
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+
+    uri = engine.url.render_as_string(hide_password=False)
+    with adbc_pg.connect(uri) as conn:
+        with conn.cursor() as cur:
+            cur.execute("SET synchronous_commit = off")
+            cur.adbc_ingest(table_name, table, mode="append")
+        conn.commit()
+
+
+def _copy_from_csv(df: pd.DataFrame, table_name: str, engine) -> None:
+    buf = io.StringIO()
+    df.to_csv(buf, index=False, header=False, na_rep="\\N", sep="\t")
+    buf.seek(0)
+
+    cols = ", ".join(f'"{col}"' for col in df.columns)
+    conn = engine.raw_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.copy_expert(
+                f'COPY "{table_name}" ({cols}) FROM STDIN '
+                "WITH (FORMAT CSV, NULL '\\N', DELIMITER E'\\t')",
+                buf,
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def _load_to_db(
-    df: pd.DataFrame, table_name: str, engine, seasons: list[str], replace: bool
+    df: pd.DataFrame,
+    table_name: str,
+    engine,
+    seasons: list[str],
+    replace: bool,
+    existing_tables: set[str],
+    table_cols: dict[str, set[str]],
 ) -> None:
     if replace:
-        df.to_sql(table_name, engine, if_exists="replace", index=False)
+        df.head(0).to_sql(table_name, engine, if_exists="replace", index=False)
+        existing_tables.add(table_name)
+        table_cols[table_name] = set(df.columns)
+        _copy_from_df(df, table_name, engine)
     else:
-        _ensure_table_schema(df, table_name, engine)
-        _delete_existing_rows(engine, table_name, seasons)
-        df.to_sql(table_name, engine, if_exists="append", index=False)
+        _ensure_table_schema(df, table_name, engine, existing_tables, table_cols)
+        _delete_existing_rows(engine, table_name, seasons, existing_tables)
+        _copy_from_df(df, table_name, engine)
+
 
+def _record_ingest_runs(engine, ingest_rows: list[dict]) -> None:
+    if not ingest_rows:
+        return
     with engine.begin() as conn:
         conn.execute(
             text(
@@ -135,7 +265,7 @@ def _load_to_db(
                 VALUES (:table_name, :row_count)
                 """
             ),
-            {"table_name": table_name, "row_count": int(len(df))},
+            ingest_rows,
         )
 
 
@@ -147,12 +277,21 @@ def main() -> None:
     seasons = _parse_seasons(os.environ.get("FBREF_SEASONS"))
     replace = os.environ.get("FBREF_RESET") == "1"
 
-    engine = create_engine(db_url)
+    engine = create_engine(
+        db_url,
+        executemany_mode="values_plus_batch",
+        executemany_batch_page_size=500,
+        insertmanyvalues_page_size=1000,
+        # Ingest is re-runnable, so skip the WAL flush wait on every commit.
+        connect_args={"options": "-c synchronous_commit=off"},
+    )
 
     schema_path = Path(__file__).resolve().parent / "schema.sql"
     with engine.begin() as conn:
         conn.execute(text(schema_path.read_text(encoding="utf-8")))
 
+    existing_tables, table_cols = _snapshot_table_metadata(engine)
+
     total_rows = 0
     print(f"Seasons: {', '.join(seasons)}")
     if replace:
@@ -160,42 +299,33 @@ def main() -> None:
     else:
         print("Mode: incremental (append by season)")
 
+    jobs = [("team", stat_type) for stat_type in TEAM_MATCH_STAT_TYPES]
+    jobs += [("player", stat_type) for stat_type in PLAYER_MATCH_STAT_TYPES]
+
+    print(f"Fetching {len(jobs)} stat_types with {FETCH_WORKERS} workers...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        fetched = list(executor.map(lambda job: _fetch_match_stats(*job, seasons, replace), jobs))
+    frames = dict(zip(jobs, fetched))
+
+    ingest_rows = []
     for stat_type in TEAM_MATCH_STAT_TYPES:
-        print(f"Starting team match stats: {stat_type}...")
-        frames = []
-        for season in seasons:
-            print(f"  Season {season}...")
-            fbref = sd.FBref(leagues=COMPETITION, seasons=season)
-            match_stats = fbref.read_team_match_stats(stat_type=stat_type).reset_index()
-            match_stats = _normalize_columns(match_stats)
-            match_stats["season"] = season
-            match_stats["competition"] = COMPETITION
-            match_stats["source"] = SOURCE
-            frames.append(match_stats)
-        match_stats = pd.concat(frames, ignore_index=True, sort=False) if frames else pd.DataFrame()
+        match_stats = frames.get(("team", stat_type), pd.DataFrame())
         table_name = f"fbref_team_match_{stat_type}"
-        _load_to_db(match_stats, table_name, engine, seasons, replace)
+        _load_to_db(match_stats, table_name, engine, seasons, replace, existing_tables, table_cols)
+        ingest_rows.append({"table_name": table_name, "row_count": int(len(match_stats))})
         print(f"Finished team match stats: {stat_type} ({len(match_stats)} rows).")
         total_rows += len(match_stats)
 
     for stat_type in PLAYER_MATCH_STAT_TYPES:
-        print(f"Starting player match stats: {stat_type}...")
-        frames = []
-        for season in seasons:
-            print(f"  Season {season}...")
-            fbref = sd.FBref(leagues=COMPETITION, seasons=season)
-            player_stats = fbref.read_player_match_stats(stat_type=stat_type).reset_index()
-            player_stats = _normalize_columns(player_stats)
-            player_stats["season"] = season
-            player_stats["competition"] = COMPETITION
-            player_stats["source"] = SOURCE
-            frames.append(player_stats)
-        player_stats = pd.concat(frames, ignore_index=True, sort=False) if frames else pd.DataFrame()
+        player_stats = frames.get(("player", stat_type), pd.DataFrame())
         table_name = f"fbref_player_match_{stat_type}"
-        _load_to_db(player_stats, table_name, engine, seasons, replace)
+        _load_to_db(player_stats, table_name, engine, seasons, replace, existing_tables, table_cols)
+        ingest_rows.append({"table_name": table_name, "row_count": int(len(player_stats))})
         print(f"Finished player match stats: {stat_type} ({len(player_stats)} rows).")
         total_rows += len(player_stats)
 
+    _record_ingest_runs(engine, ingest_rows)
+
     print(f"Loaded {total_rows} rows across {len(TEAM_MATCH_STAT_TYPES) + len(PLAYER_MATCH_STAT_TYPES)} tables.")
 
 
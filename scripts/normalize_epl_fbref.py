@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine, inspect, text
 
@@ -15,6 +16,8 @@ DEFAULT_SEASONS = [
     "2024-2025",
 ]
 DEFAULT_COMPETITION = "ENG-Premier League"
+TO_SQL_KWARGS = dict(method="multi", chunksize=1000, index=False)
+CATEGORY_COLUMNS = ["season", "competition", "team", "opponent", "venue"]
 TEAM_NAME_FIXUPS = {
     "Newcastle Utd": "Newcastle United",
     "Nott'ham Forest": "Nottingham Forest",
@@ -49,22 +52,21 @@ def _coerce_int(series: pd.Series) -> pd.Series:
 
 
 def _apply_team_name_fixes(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
-    df = df.copy()
-    for column in columns:
-        if column in df.columns:
-            df[column] = df[column].replace(TEAM_NAME_FIXUPS)
-    return df
+    fixes = {column: df[column].replace(TEAM_NAME_FIXUPS) for column in columns if column in df.columns}
+    return df.assign(**fixes) if fixes else df
+
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    columns = [column for column in CATEGORY_COLUMNS if column in df.columns]
+    return df.astype({column: "category" for column in columns}) if columns else df
 
 
 def _ensure_competition_column(df: pd.DataFrame, competition: str) -> pd.DataFrame:
     if "competition" in df.columns:
         return df
-    df = df.copy()
     if "league" in df.columns:
-        df["competition"] = df["league"]
-    else:
-        df["competition"] = competition
-    return df
+        return df.assign(competition=df["league"])
+    return df.assign(competition=competition)
 
 
 def _filter_by_season_and_competition(
@@ -82,6 +84,16 @@ def _filter_by_season_and_competition(
     return df
 
 
+def _read_raw_table(engine, db_url: str, table_name: str) -> pd.DataFrame:
+    try:
+        import connectorx as cx
+    except ImportError:
+        return pd.read_sql(f"SELECT * FROM {table_name}", engine)
+
+    table = cx.read_sql(db_url, f"SELECT * FROM {table_name}", return_type="arrow")
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
 def _table_exists(engine, table_name: str) -> bool:
     inspector = inspect(engine)
     return inspector.has_table(table_name)
@@ -129,30 +141,32 @@ def _prepare_schedule(schedule: pd.DataFrame, competition: str) -> pd.DataFrame:
     if "game" not in schedule.columns and "game_id" not in schedule.columns:
         raise SystemExit("Schedule table missing game/game_id column.")
 
-    schedule = schedule.copy()
     if "game" in schedule.columns:
         if "game_id" in schedule.columns:
             schedule = schedule.drop(columns=["game_id"])
         schedule = schedule.rename(columns={"game": "game_id"})
-    schedule = schedule.loc[:, ~schedule.columns.duplicated()]
+    dupe_mask = schedule.columns.duplicated()
+    if dupe_mask.any():
+        schedule = schedule.loc[:, ~dupe_mask]
     schedule = _ensure_competition_column(schedule, competition)
     schedule = _apply_team_name_fixes(schedule, ["team", "opponent"])
-    return schedule
+    return _categorize(schedule)
 
 
 def _prepare_player_summary(player_summary: pd.DataFrame, competition: str) -> pd.DataFrame:
     if "game" not in player_summary.columns and "game_id" not in player_summary.columns:
         raise SystemExit("Player summary missing game/game_id column.")
 
-    player_summary = player_summary.copy()
     if "game" in player_summary.columns:
         if "game_id" in player_summary.columns:
             player_summary = player_summary.drop(columns=["game_id"])
         player_summary = player_summary.rename(columns={"game": "game_id"})
-    player_summary = player_summary.loc[:, ~player_summary.columns.duplicated()]
+    dupe_mask = player_summary.columns.duplicated()
+    if dupe_mask.any():
+        player_summary = player_summary.loc[:, ~dupe_mask]
     player_summary = _ensure_competition_column(player_summary, competition)
     player_summary = _apply_team_name_fixes(player_summary, ["team"])
-    return player_summary
+    return _categorize(player_summary)
 
 
 def _build_matches(schedule: pd.DataFrame, fbref_map: pd.DataFrame | None) -> pd.DataFrame:
@@ -161,46 +175,50 @@ def _build_matches(schedule: pd.DataFrame, fbref_map: pd.DataFrame | None) -> pd
     if missing:
         raise SystemExit(f"Schedule table missing columns: {missing}")
 
-    schedule = schedule.copy()
-    schedule["date"] = pd.to_datetime(schedule["date"], errors="coerce")
-
-    match_rows = []
-    for game_id, group in schedule.groupby("game_id"):
-        row = group.iloc[0]
-        venue = group["venue"].fillna("").astype(str).str.lower()
-        home_row = group[venue == "home"]
-        away_row = group[venue == "away"]
-
-        if not home_row.empty:
-            home_team = home_row.iloc[0]["team"]
-            away_team = home_row.iloc[0]["opponent"]
-        elif not away_row.empty:
-            home_team = away_row.iloc[0]["opponent"]
-            away_team = away_row.iloc[0]["team"]
-        else:
-            home_team = row["team"]
-            away_team = row["opponent"]
-
-        match_rows.append(
-            {
-                "game_id": game_id,
-                "competition": row.get("competition"),
-                "season": row.get("season"),
-                "match_date": row.get("date"),
-                "home_team": home_team,
-                "away_team": away_team,
-            }
-        )
+    schedule = schedule.assign(date=pd.to_datetime(schedule["date"], errors="coerce"))
+    # On a categorical column this lower-cases the handful of category values,
+    # not every row.
+    venue = schedule["venue"].map(lambda value: str(value).lower(), na_action="ignore")
 
-    matches = pd.DataFrame(match_rows)
+    base = schedule.drop_duplicates(subset=["game_id"])[
+        ["game_id", "competition", "season", "date", "team", "opponent"]
+    ].rename(columns={"date": "match_date"})
+
+    home = (
+        schedule.loc[venue == "home", ["game_id", "team", "opponent"]]
+        .drop_duplicates(subset=["game_id"])
+        .rename(columns={"team": "home_team", "opponent": "away_team"})
+    )
+    away = (
+        schedule.loc[venue == "away", ["game_id", "opponent", "team"]]
+        .drop_duplicates(subset=["game_id"])
+        .rename(columns={"opponent": "home_team_alt", "team": "away_team_alt"})
+    )
+
+    matches = base.merge(home, on="game_id", how="left").merge(away, on="game_id", how="left")
+    # The merged sides carry category dtypes with differing codes, so resolve
+    # the fallback chain on object dtype; the matches frame is small.
+    home_team = matches["home_team"].astype(object)
+    away_team = matches["away_team"].astype(object)
+    matches["home_team"] = home_team.fillna(matches["home_team_alt"].astype(object)).fillna(
+        matches["team"].astype(object)
+    )
+    matches["away_team"] = away_team.fillna(matches["away_team_alt"].astype(object)).fillna(
+        matches["opponent"].astype(object)
+    )
+    matches = matches[
+        ["game_id", "competition", "season", "match_date", "home_team", "away_team"]
+    ]
     if fbref_map is not None and not fbref_map.empty:
         matches = matches.merge(fbref_map, on="game_id", how="left")
     return matches
 
 
 def _build_teams(schedule: pd.DataFrame) -> pd.DataFrame:
-    teams = pd.concat([schedule["team"], schedule["opponent"]]).dropna().unique()
-    return pd.DataFrame({"name": sorted(teams)})
+    teams = np.union1d(
+        schedule["team"].dropna().to_numpy(), schedule["opponent"].dropna().to_numpy()
+    )
+    return pd.DataFrame({"name": teams})
 
 
 def _build_team_match_stats(schedule: pd.DataFrame) -> pd.DataFrame:
@@ -262,21 +280,29 @@ def _build_player_match_stats(
     if drop_cols:
         stats = stats.drop(columns=drop_cols)
 
-    stats = stats.merge(opponent_df, on=["game_id", "team"], how="left")
-
-    stats["minutes"] = _coerce_int(stats[minutes_col]) if minutes_col else pd.Series(
-        [pd.NA] * len(stats), dtype="Int64"
-    )
-    stats["goals"] = _coerce_int(stats[goals_col]) if goals_col else pd.Series(
-        [pd.NA] * len(stats), dtype="Int64"
-    )
-    stats["assists"] = _coerce_int(stats[assists_col]) if assists_col else pd.Series(
-        [pd.NA] * len(stats), dtype="Int64"
-    )
-    stats["shots"] = _coerce_int(stats[shots_col]) if shots_col else pd.Series(
-        [pd.NA] * len(stats), dtype="Int64"
+    lookup = opponent_df.set_index(["game_id", "team"])
+    keys = pd.MultiIndex.from_arrays([stats["game_id"], stats["team"]])
+    stats = stats.assign(
+        opponent=keys.map(lookup["opponent"]),
+        competition=keys.map(lookup["competition"]),
+        season=keys.map(lookup["season"]),
     )
 
+    src_cols = {
+        "minutes": minutes_col,
+        "goals": goals_col,
+        "assists": assists_col,
+        "shots": shots_col,
+    }
+    present = {target: source for target, source in src_cols.items() if source}
+    if present:
+        coerced = stats[list(present.values())].apply(pd.to_numeric, errors="coerce").astype("Int64")
+        coerced.columns = list(present.keys())
+        stats[list(present.keys())] = coerced
+    for target in src_cols:
+        if target not in present:
+            stats[target] = pd.Series([pd.NA] * len(stats), dtype="Int64")
+
     keep = [
         "game_id",
         "player",
@@ -301,7 +327,12 @@ def main() -> None:
     competition = _parse_competition(os.environ.get("FBREF_COMPETITION"))
     replace = os.environ.get("FBREF_RESET") == "1"
 
-    engine = create_engine(db_url)
+    engine = create_engine(
+        db_url,
+        executemany_mode="values_plus_batch",
+        executemany_batch_page_size=500,
+        insertmanyvalues_page_size=1000,
+    )
 
     print(f"Seasons: {', '.join(seasons)}")
     print(f"Competition: {competition}")
@@ -319,8 +350,8 @@ def main() -> None:
     with engine.begin() as conn:
         conn.execute(text(schema_path.read_text(encoding="utf-8")))
 
-    schedule = pd.read_sql(f"SELECT * FROM {RAW_TEAM_SCHEDULE}", engine)
-    player_summary = pd.read_sql(f"SELECT * FROM {RAW_PLAYER_SUMMARY}", engine)
+    schedule = _read_raw_table(engine, db_url, RAW_TEAM_SCHEDULE)
+    player_summary = _read_raw_table(engine, db_url, RAW_PLAYER_SUMMARY)
 
     schedule = _filter_by_season_and_competition(schedule, seasons, competition)
     player_summary = _filter_by_season_and_competition(player_summary, seasons, competition)
@@ -336,9 +367,7 @@ def main() -> None:
         fbref_map = (
             player_summary[["game", "game_id"]]
             .dropna()
-            .drop_duplicates()
-            .groupby("game", as_index=False)["game_id"]
-            .first()
+            .drop_duplicates(subset=["game"])
             .rename(columns={"game": "game_id", "game_id": "fbref_match_id"})
         )
 
@@ -373,15 +402,15 @@ def main() -> None:
     players = _filter_existing_names(engine, "players", "name", players)
 
     if not teams.empty:
-        teams.to_sql("teams", engine, if_exists="append", index=False)
+        teams.to_sql("teams", engine, if_exists="append", **TO_SQL_KWARGS)
     if not matches.empty:
-        matches.to_sql("matches", engine, if_exists="append", index=False)
+        matches.to_sql("matches", engine, if_exists="append", **TO_SQL_KWARGS)
     if not team_match_stats.empty:
-        team_match_stats.to_sql("team_match_stats", engine, if_exists="append", index=False)
+        team_match_stats.to_sql("team_match_stats", engine, if_exists="append", **TO_SQL_KWARGS)
     if not players.empty:
-        players.to_sql("players", engine, if_exists="append", index=False)
+        players.to_sql("players", engine, if_exists="append", **TO_SQL_KWARGS)
     if not player_match_stats.empty:
-        player_match_stats.to_sql("player_match_stats", engine, if_exists="append", index=False)
+        player_match_stats.to_sql("player_match_stats", engine, if_exists="append", **TO_SQL_KWARGS)
 
     print(
         "Normalized tables created: teams, matches, team_match_stats, players, player_match_stats."